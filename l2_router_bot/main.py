@@ -13,15 +13,18 @@ from __future__ import annotations
 import os
 from typing import Dict, Optional
 
+import httpx  # type: ignore
 from fastapi import FastAPI, HTTPException
 from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
 from web3 import Web3  # type: ignore
 
+from . import rpc
 from .networks import get_networks
 from .router import estimate_transfer_costs, select_cheapest_network
 from .tx_sender import TransactionSender
+from .utils import price_feed
 
 
 app = FastAPI(title="L2 Gas‑Optimized Router", version="1.0.0")
@@ -38,6 +41,20 @@ app.mount(
 )
 
 
+@app.on_event("startup")
+async def _startup() -> None:
+    """Create the shared HTTP clients used for price and RPC requests."""
+    await price_feed.set_client(httpx.AsyncClient(timeout=10, http2=True))
+    await rpc.set_client(httpx.AsyncClient(timeout=10, http2=True))
+
+
+@app.on_event("shutdown")
+async def _shutdown() -> None:
+    """Close the shared HTTP clients."""
+    await price_feed.aclose()
+    await rpc.aclose()
+
+
 class EstimateRequest(BaseModel):
     """Schema for estimation and routing requests."""
 
@@ -117,7 +134,7 @@ async def send(request: SendRequest) -> Dict[str, str]:
     amount_wei = Web3.to_wei(request.amount_eth, "ether")
     sender = TransactionSender()
     try:
-        tx_hash = sender.send_transfer(
+        tx_hash = await sender.send_transfer(
             request.network,
             request.from_address,
             request.to_address,
@@ -145,7 +162,7 @@ async def route_and_send(request: EstimateRequest) -> Dict[str, str | Dict]:
         raise HTTPException(status_code=500, detail="Failed to estimate costs on all networks")
     sender = TransactionSender()
     try:
-        tx_hash = sender.send_transfer(
+        tx_hash = await sender.send_transfer(
             network,
             request.from_address,
             request.to_address,
@@ -0,0 +1,125 @@
+"""Aggregated contract reads through the Multicall3 contract.
+
+Reading contract state on a network (fee oracles, token balances,
+bridge quotes) normally costs one ``eth_call`` per read.  Multicall3
+is deployed at the same address on every supported network and
+executes a list of calls on the node side, so any number of reads can
+be served by a single ``eth_call``.
+
+This helper only covers ``eth_call`` reads.  Node methods such as
+``eth_gasPrice`` or ``eth_estimateGas`` cannot be aggregated this way;
+those are batched at the JSON‑RPC level by :mod:`l2_router_bot.rpc`.
+
+:func:`get_l1_fee_params` reads the L1 data fee inputs of OP Stack
+networks.  Fee estimates do not include the L1 data fee yet.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from eth_abi import decode, encode  # type: ignore
+from web3 import AsyncWeb3, Web3  # type: ignore
+
+from .networks import NetworkConfig
+
+
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# Function selector for ``aggregate3((address,bool,bytes)[])``.
+_AGGREGATE3_SELECTOR = bytes.fromhex("82ad56cb")
+
+
+def encode_aggregate3(
+    calls: Sequence[Tuple[str, bytes]],
+    allow_failure: bool = False,
+) -> bytes:
+    """Encode calldata for ``Multicall3.aggregate3``.
+
+    Args:
+        calls: Sequence of ``(target_address, calldata)`` pairs.
+        allow_failure: Whether individual calls may revert without
+            reverting the whole aggregate.
+
+    Returns:
+        The ABI‑encoded calldata, including the function selector.
+    """
+
+    encoded = encode(
+        ["(address,bool,bytes)[]"],
+        [[(Web3.to_checksum_address(target), allow_failure, data) for target, data in calls]],
+    )
+    return _AGGREGATE3_SELECTOR + encoded
+
+
+def decode_aggregate3(data: bytes) -> List[Optional[bytes]]:
+    """Decode the return value of ``Multicall3.aggregate3``.
+
+    Returns:
+        The return data of each call, or ``None`` for calls that failed.
+    """
+
+    (results,) = decode(["(bool,bytes)[]"], data)
+    return [return_data if success else None for success, return_data in results]
+
+
+async def multicall(
+    w3: AsyncWeb3,
+    calls: Sequence[Tuple[str, bytes]],
+    allow_failure: bool = False,
+) -> List[Optional[bytes]]:
+    """Execute several contract reads with a single ``eth_call``.
+
+    Args:
+        w3: Web3 client for the target network.
+        calls: Sequence of ``(target_address, calldata)`` pairs.
+        allow_failure: If ``True``, failed calls yield ``None`` instead of
+            reverting the whole aggregate.
+
+    Returns:
+        The raw return data of each call, in the order given.
+
+    Raises:
+        Exception: If the RPC request fails or, when ``allow_failure`` is
+            ``False``, any of the calls reverts.
+    """
+
+    if not calls:
+        return []
+    tx = {
+        "to": MULTICALL3_ADDRESS,
+        "data": Web3.to_hex(encode_aggregate3(calls, allow_failure)),
+    }
+    raw = await w3.eth.call(tx)
+    return decode_aggregate3(bytes(raw))
+
+
+# Read-only getters on the OP Stack GasPriceOracle used to derive the L1
+# data fee surcharge, keyed by the name under which they are returned.
+_L1_FEE_GETTERS: Dict[str, bytes] = {
+    "l1_base_fee": bytes.fromhex("519b4bd3"),  # l1BaseFee()
+    "blob_base_fee": bytes.fromhex("f8206140"),  # blobBaseFee()
+    "base_fee_scalar": bytes.fromhex("c5985918"),  # baseFeeScalar()
+    "blob_base_fee_scalar": bytes.fromhex("68d5dca6"),  # blobBaseFeeScalar()
+}
+
+
+async def get_l1_fee_params(cfg: NetworkConfig, w3: AsyncWeb3) -> Dict[str, int]:
+    """Read the L1 data fee parameters of an OP Stack network.
+
+    All oracle getters are aggregated through :func:`multicall` so that
+    the parameters cost a single ``eth_call``.
+
+    Returns:
+        A mapping of parameter name to value, or an empty mapping for
+        networks without an L1 fee oracle.
+    """
+    if cfg.l1_fee_oracle is None:
+        return {}
+    returned = await multicall(
+        w3, [(cfg.l1_fee_oracle, selector) for selector in _L1_FEE_GETTERS.values()]
+    )
+    return {
+        key: int.from_bytes(data, "big")
+        for key, data in zip(_L1_FEE_GETTERS, returned)
+    }
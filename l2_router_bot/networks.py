@@ -1,8 +1,8 @@
 """Configuration and client utilities for supported Layer‑2 networks.
 
 This module defines immutable network configurations and helper
-functions to produce :class:`web3.Web3` clients for each supported
-network.  RPC endpoints can be overridden using environment
+functions to produce :class:`web3.AsyncWeb3` clients for each
+supported network.  RPC endpoints can be overridden using environment
 variables named ``ARBITRUM_RPC_URL``, ``OPTIMISM_RPC_URL`` and
 ``BASE_RPC_URL`` respectively.  Additional networks can be added by
 extending the ``DEFAULT_NETWORKS`` dictionary.
@@ -14,16 +14,18 @@ sure to consult the network's documentation for the correct chain
 identifier.
 
 This module contains no side effects on import and is safe to
-import from any context.
+import from any context.  Network configurations and clients are
+created lazily on first use and then memoised.
 """
 
 from __future__ import annotations
 
+import functools
 import os
-from dataclasses import dataclass
-from typing import Dict
+from dataclasses import dataclass, replace
+from typing import Dict, Optional
 
-from web3 import Web3  # type: ignore
+from web3 import AsyncHTTPProvider, AsyncWeb3, Web3  # type: ignore
 
 
 @dataclass(frozen=True)
@@ -35,12 +37,29 @@ class NetworkConfig:
         rpc_url: JSON‑RPC endpoint for the network.
         chain_id: Integer chain identifier as defined by EIP‑155.
         native_symbol: Symbol for the native currency (e.g. ``ETH``).
+        l1_fee_oracle: Address of the L1 data fee oracle on OP Stack
+            networks, or ``None`` if the network has none.
+        plain_transfer_gas: Gas used by a plain Ether transfer to an
+            externally owned account where that is a fixed amount, or
+            ``None`` where it must be estimated.
     """
 
     name: str
     rpc_url: str
     chain_id: int
     native_symbol: str
+    l1_fee_oracle: Optional[str] = None
+    plain_transfer_gas: Optional[int] = None
+
+
+# GasPriceOracle predeploy shared by all OP Stack networks.
+OP_STACK_GAS_PRICE_ORACLE = "0x420000000000000000000000000000000000000F"
+
+# Intrinsic gas of a transfer without calldata.  OP Stack networks
+# charge the L1 data fee separately, so L2 gas is exactly this amount.
+# Arbitrum folds the L1 posting cost into the L2 gas figure, so its
+# estimate is higher and varies with L1 prices.
+PLAIN_TRANSFER_GAS = 21000
 
 
 # Default network definitions.  Feel free to extend this dictionary
@@ -58,16 +77,21 @@ DEFAULT_NETWORKS: Dict[str, NetworkConfig] = {
         rpc_url="https://mainnet.optimism.io",
         chain_id=10,
         native_symbol="ETH",
+        l1_fee_oracle=OP_STACK_GAS_PRICE_ORACLE,
+        plain_transfer_gas=PLAIN_TRANSFER_GAS,
     ),
     "base": NetworkConfig(
         name="base",
         rpc_url="https://mainnet.base.org",
         chain_id=8453,
         native_symbol="ETH",
+        l1_fee_oracle=OP_STACK_GAS_PRICE_ORACLE,
+        plain_transfer_gas=PLAIN_TRANSFER_GAS,
     ),
 }
 
 
+@functools.lru_cache(maxsize=1)
 def get_networks() -> Dict[str, NetworkConfig]:
     """Return a mapping of supported network names to their configurations.
 
@@ -76,6 +100,9 @@ def get_networks() -> Dict[str, NetworkConfig]:
     their respective networks.  Additional networks can be configured by
     extending the :data:`DEFAULT_NETWORKS` dictionary.
 
+    Environment variables are read once and the result is memoised; call
+    :func:`_reset_clients` to pick up changes.
+
     Returns:
         A dictionary keyed by network name containing :class:`NetworkConfig`
         instances.
@@ -88,32 +115,53 @@ def get_networks() -> Dict[str, NetworkConfig]:
         env_var = f"{name.upper()}_RPC_URL"
         rpc_override = os.getenv(env_var)
         if rpc_override:
-            networks[name] = NetworkConfig(
-                name=cfg.name,
-                rpc_url=rpc_override,
-                chain_id=cfg.chain_id,
-                native_symbol=cfg.native_symbol,
-            )
+            networks[name] = replace(cfg, rpc_url=rpc_override)
         else:
             networks[name] = cfg
     return networks
 
 
-def get_web3_clients() -> Dict[str, Web3]:
-    """Instantiate a :class:`web3.Web3` client for each configured network.
+@functools.lru_cache(maxsize=1)
+def get_web3_clients() -> Dict[str, AsyncWeb3]:
+    """Return an :class:`web3.AsyncWeb3` client for each configured network.
 
-    This helper caches nothing; it simply creates a new Web3 instance
-    for each configured network.  If you plan to perform many RPC
-    operations, you may wish to memoise this function at a higher
-    layer of your application.
+    Clients are created on first use and memoised for the lifetime of
+    the process, so that each provider's HTTP session and middleware
+    stack are built only once and connections are reused across
+    requests.
 
     Returns:
-        A dictionary mapping network names to instantiated Web3 clients.
+        A dictionary mapping network names to instantiated AsyncWeb3 clients.
+    """
+
+    # Use HTTP provider; applications requiring higher throughput may
+    # prefer WebSocket providers.
+    return {
+        name: AsyncWeb3(AsyncHTTPProvider(cfg.rpc_url, request_kwargs={"timeout": 10}))
+        for name, cfg in get_networks().items()
+    }
+
+
+@functools.lru_cache(maxsize=1024)
+def checksum_address(address: str) -> str:
+    """Return the EIP‑55 checksummed form of ``address``.
+
+    Checksumming hashes the address with Keccak‑256; results are
+    memoised because the same sender and recipient addresses recur
+    across requests.
+
+    Raises:
+        ValueError: If ``address`` is not a valid hex address.
+    """
+
+    return Web3.to_checksum_address(address)
+
+
+def _reset_clients() -> None:
+    """Clear memoised network configurations and clients.
+
+    Intended for tests that change RPC environment variables.
     """
 
-    clients: Dict[str, Web3] = {}
-    for name, cfg in get_networks().items():
-        # Use HTTP provider; applications requiring higher throughput may
-        # prefer WebSocket providers.
-        clients[name] = Web3(Web3.HTTPProvider(cfg.rpc_url))
-    return clients
+    get_networks.cache_clear()
+    get_web3_clients.cache_clear()
@@ -6,82 +6,245 @@ estimate transaction fees per network and to select the cheapest
 option.  It is designed to be used both by the FastAPI endpoints
 and programmatically from other modules.
 
-The functions herein are asynchronous because price feeds may
-involve network I/O.  Web3 calls are performed synchronously
-because the underlying library does not yet support asyncio.  If
-`web3.py` adds native async support in the future, these functions
-can be refactored accordingly.
+The functions herein are asynchronous because both price feeds and
+RPC calls involve network I/O.  Estimation batches its calls through
+:mod:`l2_router_bot.rpc` and only falls back to individual
+:class:`web3.AsyncWeb3` calls for endpoints that reject batch
+requests.
 """
 
 from __future__ import annotations
 
-from typing import Dict, Optional
-from web3 import Web3  # type: ignore
+import asyncio
+import os
+import time
+from typing import Dict, Optional, Tuple
+from web3 import AsyncWeb3, Web3  # type: ignore
 
-from .networks import get_networks, get_web3_clients, NetworkConfig
+from .networks import checksum_address, get_networks, get_web3_clients, NetworkConfig
+from .rpc import BatchNotSupportedError, batch_request
 from .utils.price_feed import get_token_price
 
+
+# Gas prices on L2s change slowly relative to request rates, so a short
+# per-network cache avoids an RPC round trip on most requests.  Nonces
+# are cached much more briefly and invalidated whenever a transaction
+# is sent.
+GAS_PRICE_TTL_SECONDS = 8.0
+NONCE_TTL_SECONDS = 1.0
+
+# Set SKIP_GAS_ESTIMATE=true to skip ``eth_estimateGas`` for plain
+# transfers on networks whose ``plain_transfer_gas`` is fixed.  This only
+# affects fee estimates; transactions are always signed with an
+# estimated gas limit.  Leave it unset if recipients may be contracts
+# whose fallback logic consumes additional gas.
+SKIP_GAS_ESTIMATE = os.getenv("SKIP_GAS_ESTIMATE", "false").lower() == "true"
+
+_GAS_CACHE: Dict[str, Tuple[float, int]] = {}
+_NONCE_CACHE: Dict[Tuple[str, str], Tuple[float, int]] = {}
+
+
+def _fresh_gas_price(name: str, ttl: float = GAS_PRICE_TTL_SECONDS) -> Optional[int]:
+    """Return the cached gas price for ``name`` if it is younger than ``ttl``."""
+    cached = _GAS_CACHE.get(name)
+    if cached is not None and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+    return None
+
+
+async def cached_gas_price(
+    name: str,
+    w3: AsyncWeb3,
+    ttl: float = GAS_PRICE_TTL_SECONDS,
+) -> int:
+    """Return the gas price for a network, reusing recent values.
+
+    Args:
+        name: Network name used as the cache key.
+        w3: Web3 client used on a cache miss.
+        ttl: Maximum age of a cached value in seconds.
+    """
+    value = _fresh_gas_price(name, ttl)
+    if value is not None:
+        return value
+    value = int(await w3.eth.gas_price)
+    _GAS_CACHE[name] = (time.monotonic(), value)
+    return value
+
+
+async def cached_nonce(
+    name: str,
+    w3: AsyncWeb3,
+    address: str,
+    ttl: float = NONCE_TTL_SECONDS,
+) -> int:
+    """Return the transaction count for ``address``, reusing recent values.
+
+    Args:
+        name: Network name used as part of the cache key.
+        w3: Web3 client used on a cache miss.
+        address: Checksummed account address.
+        ttl: Maximum age of a cached value in seconds.
+    """
+    key = (name, address)
+    cached = _NONCE_CACHE.get(key)
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < ttl:
+        return cached[1]
+    value = int(await w3.eth.get_transaction_count(address))
+    _NONCE_CACHE[key] = (now, value)
+    return value
+
+
+def known_gas_limit(cfg: NetworkConfig, tx: Dict) -> Optional[int]:
+    """Return the gas used by ``tx`` on ``cfg`` if known without an RPC call.
+
+    Only plain transfers on networks with a fixed
+    :attr:`NetworkConfig.plain_transfer_gas` qualify, and only when
+    :data:`SKIP_GAS_ESTIMATE` is enabled.
+    """
+    if SKIP_GAS_ESTIMATE and not tx.get("data"):
+        return cfg.plain_transfer_gas
+    return None
+
+
+def invalidate_nonce(name: str, address: str) -> None:
+    """Drop the cached nonce for ``address`` on network ``name``."""
+    _NONCE_CACHE.pop((name, address), None)
+
+
+def _fee_summary(gas_price: int, estimated_gas: int) -> Dict[str, Optional[float]]:
+    """Build the per-network cost entry from a gas price and gas estimate."""
+    total_fee_wei = gas_price * estimated_gas
+    total_fee_native = Web3.from_wei(total_fee_wei, "ether")
+    return {
+        "gas_price_wei": int(gas_price),
+        "estimated_gas": int(estimated_gas),
+        "total_fee_wei": int(total_fee_wei),
+        "total_fee_native": float(total_fee_native),
+        "total_fee_usd": None,
+    }
+
+
+async def _estimate_one(
+    name: str,
+    w3: AsyncWeb3,
+    base_tx: Dict,
+    estimated_gas: Optional[int] = None,
+) -> Dict[str, Optional[float]]:
+    """Query gas price and gas estimate for a single network.
+
+    This issues one HTTP request per call and serves as the fallback
+    for endpoints that do not accept JSON‑RPC batch requests.  Like the
+    batched path it sends ``base_tx`` unchanged, without a nonce.  A
+    known ``estimated_gas`` skips ``eth_estimateGas``.
+    """
+    gas_price = await cached_gas_price(name, w3)
+    if estimated_gas is None:
+        estimated_gas = await w3.eth.estimate_gas(base_tx)
+    return _fee_summary(gas_price, estimated_gas)
+
+
+async def _estimate_batched(
+    name: str,
+    cfg: NetworkConfig,
+    w3: AsyncWeb3,
+    base_tx: Dict,
+    rpc_tx: Dict,
+) -> Dict[str, Optional[float]]:
+    """Estimate fees for a single network using one JSON‑RPC batch.
+
+    Gas price and gas estimate are requested in a single HTTP round
+    trip.  Either call is skipped when its value is already known (a
+    cached gas price, or a plain transfer's fixed gas), so a request
+    may need no RPC at all.  The nonce is omitted because
+    ``eth_estimateGas`` does not need it.  Endpoints that reject batch
+    requests fall back to :func:`_estimate_one`.
+
+    ``base_tx`` and its hex‑encoded JSON‑RPC form ``rpc_tx`` are shared
+    by all networks and must not be modified.
+    """
+    gas_price = _fresh_gas_price(name)
+    estimated_gas = known_gas_limit(cfg, base_tx)
+    calls = []
+    if gas_price is None:
+        calls.append(("eth_gasPrice", []))
+    if estimated_gas is None:
+        calls.append(("eth_estimateGas", [rpc_tx]))
+    if calls:
+        try:
+            results = iter(await batch_request(cfg.rpc_url, calls))
+        except BatchNotSupportedError:
+            return await _estimate_one(name, w3, base_tx, estimated_gas)
+        if gas_price is None:
+            gas_price = int(next(results), 16)
+            _GAS_CACHE[name] = (time.monotonic(), gas_price)
+        if estimated_gas is None:
+            estimated_gas = int(next(results), 16)
+    return _fee_summary(gas_price, estimated_gas)
+
+
 async def estimate_transfer_costs(
     from_address: str,
     to_address: str,
     amount_wei: int,
     include_usd: bool = True,
 ) -> Dict[str, Dict[str, Optional[float]]]:
-    """Estimate the cost of sending a transfer across all configured L2 networks."""
+    """Estimate the cost of sending a transfer across all configured L2 networks.
+
+    Each network is queried with a single JSON‑RPC batch request and
+    all networks are queried concurrently, so the total latency is
+    bounded by the slowest RPC endpoint rather than the sum of all of
+    them.  USD prices are fetched once per native token, concurrently
+    with the RPC calls.
+    """
     networks: Dict[str, NetworkConfig] = get_networks()
     clients = get_web3_clients()
     results: Dict[str, Dict[str, Optional[float]]] = {}
 
-    any_client: Web3 = next(iter(clients.values()))
     try:
-        from_checksum = any_client.to_checksum_address(from_address)
-        to_checksum = any_client.to_checksum_address(to_address)
+        from_checksum = checksum_address(from_address)
+        to_checksum = checksum_address(to_address)
     except Exception as exc:
         raise ValueError(f"Invalid address provided: {exc}") from exc
 
-    for name, cfg in networks.items():
-        w3: Web3 = clients[name]
-        try:
-            gas_price = w3.eth.gas_price
-            nonce = w3.eth.get_transaction_count(from_checksum)
-            tx = {
-                "from": from_checksum,
-                "to": to_checksum,
-                "value": amount_wei,
-                "nonce": nonce,
-            }
-            estimated_gas = w3.eth.estimate_gas(tx)
-            total_fee_wei = gas_price * estimated_gas
-            total_fee_native = Web3.from_wei(total_fee_wei, "ether")
-            fee_usd: Optional[float] = None
-            if include_usd:
-                price = await get_token_price(cfg.native_symbol)
-                if price is not None:
-                    fee_usd = float(total_fee_native) * price
-        except Exception as exc:
-            results[name] = {"error": str(exc)}
+    # The transaction is identical on every network; build it once.
+    base_tx = {"from": from_checksum, "to": to_checksum, "value": amount_wei}
+    rpc_tx = {**base_tx, "value": hex(amount_wei)}
+    tasks = [
+        _estimate_batched(name, cfg, clients[name], base_tx, rpc_tx)
+        for name, cfg in networks.items()
+    ]
+    # Networks sharing a native token (all of them use ETH today) share
+    # a single price lookup.  The price feed is not touched at all when
+    # USD estimates are not requested.
+    symbols = list({cfg.native_symbol for cfg in networks.values()}) if include_usd else []
+    gathered = await asyncio.gather(
+        *(get_token_price(symbol) for symbol in symbols),
+        *tasks,
+        return_exceptions=True,
+    )
+    prices: Dict[str, float] = {
+        symbol: price
+        for symbol, price in zip(symbols, gathered)
+        if price is not None and not isinstance(price, BaseException)
+    }
+
+    for (name, cfg), result in zip(networks.items(), gathered[len(symbols):]):
+        if isinstance(result, BaseException):
+            results[name] = {"error": str(result)}
             continue
-        results[name] = {
-            "gas_price_wei": int(gas_price),
-            "estimated_gas": int(estimated_gas),
-            "total_fee_wei": int(total_fee_wei),
-            "total_fee_native": float(total_fee_native),
-            "total_fee_usd": fee_usd,
-        }
+        if cfg.native_symbol in prices:
+            result["total_fee_usd"] = result["total_fee_native"] * prices[cfg.native_symbol]
+        results[name] = result
     return results
 
 
 def select_cheapest_network(costs: Dict[str, Dict[str, Optional[float]]]) -> Optional[str]:
     """Select the network with the lowest estimated total fee in wei."""
-    cheapest_name: Optional[str] = None
-    cheapest_fee: Optional[int] = None
-    for name, data in costs.items():
-        if "error" in data:
-            continue
-        fee = data.get("total_fee_wei")
-        if fee is None:
-            continue
-        if cheapest_fee is None or fee < cheapest_fee:
-            cheapest_fee = fee
-            cheapest_name = name
-    return cheapest_name
+    valid = (
+        (name, data["total_fee_wei"])
+        for name, data in costs.items()
+        if "error" not in data and data.get("total_fee_wei") is not None
+    )
+    return min(valid, key=lambda item: item[1], default=(None,))[0]
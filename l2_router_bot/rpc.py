@@ -0,0 +1,111 @@
+"""Lightweight JSON‑RPC batch client for Layer‑2 endpoints.
+
+Fee estimation needs several read‑only RPC calls per network.  Sending
+them through :mod:`web3` costs one HTTP round trip per call, which adds
+up quickly on high‑latency public endpoints.  This module bundles
+several calls into a single JSON‑RPC batch request (an array of request
+objects) sent over a shared :class:`httpx.AsyncClient`, one per event
+loop.  Payloads are encoded and decoded with :mod:`orjson`, which is
+considerably faster than the standard library's :mod:`json` on the hot
+path.
+
+Not every provider accepts batch requests.  When a batch is rejected,
+:class:`BatchNotSupportedError` is raised so that callers can fall back
+to issuing the calls individually.
+"""
+
+from __future__ import annotations
+
+from typing import Any, List, Sequence, Tuple
+
+import httpx  # type: ignore
+import orjson  # type: ignore
+
+from .utils.http_client import LoopLocalClient
+
+
+# Shared client reused across batches so that connections to each RPC
+# endpoint are kept alive between requests.
+_clients = LoopLocalClient(timeout=10)
+
+
+# HTTP statuses with which providers reject a batch payload itself.
+# Other errors, such as 429 rate limiting or 401/403 authentication
+# failures, would affect individual calls just the same and are raised.
+_BATCH_REJECTED_STATUSES = frozenset({400, 405, 413})
+
+
+class BatchNotSupportedError(Exception):
+    """Raised when an endpoint does not accept JSON‑RPC batch requests."""
+
+
+class RPCError(Exception):
+    """Raised when an individual call within a batch returns an error."""
+
+
+async def set_client(client: httpx.AsyncClient) -> None:
+    """Use ``client`` for batch requests on the running event loop.
+
+    Any client it replaces is closed.
+    """
+    await _clients.set(client)
+
+
+async def aclose() -> None:
+    """Close the running event loop's shared HTTP client."""
+    await _clients.aclose()
+
+
+async def batch_request(
+    url: str,
+    calls: Sequence[Tuple[str, List[Any]]],
+) -> List[Any]:
+    """Send several JSON‑RPC calls to ``url`` in a single HTTP request.
+
+    Args:
+        url: JSON‑RPC endpoint of the target network.
+        calls: Sequence of ``(method, params)`` pairs.
+
+    Returns:
+        The ``result`` field of each call, in the order the calls were
+        given.
+
+    Raises:
+        BatchNotSupportedError: If the endpoint rejects batch requests.
+        RPCError: If any of the calls returns a JSON‑RPC error.
+        httpx.HTTPStatusError: If the endpoint fails for another reason,
+            e.g. rate limiting.
+    """
+
+    payload = [
+        {"jsonrpc": "2.0", "id": idx, "method": method, "params": params}
+        for idx, (method, params) in enumerate(calls)
+    ]
+    response = await _clients.get().post(
+        url,
+        content=orjson.dumps(payload),
+        headers={"Content-Type": "application/json"},
+    )
+    if response.status_code in _BATCH_REJECTED_STATUSES:
+        raise BatchNotSupportedError(
+            f"Batch request rejected with HTTP {response.status_code}"
+        )
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+    if not isinstance(data, list):
+        # Providers without batch support typically answer with a single
+        # error object instead of an array.
+        raise BatchNotSupportedError("Endpoint did not return a batch response")
+
+    by_id = {item.get("id"): item for item in data if isinstance(item, dict)}
+    results: List[Any] = []
+    for idx, (method, _) in enumerate(calls):
+        item = by_id.get(idx)
+        if item is None:
+            raise BatchNotSupportedError(f"Missing response for '{method}'")
+        if item.get("error") is not None:
+            error = item["error"]
+            message = error.get("message") if isinstance(error, dict) else error
+            raise RPCError(f"{method} failed: {message}")
+        results.append(item.get("result"))
+    return results
@@ -15,9 +15,10 @@ from __future__ import annotations
 import os
 from typing import Optional
 
-from web3 import Web3  # type: ignore
+from web3 import AsyncWeb3  # type: ignore
 
-from .networks import get_networks, get_web3_clients, NetworkConfig
+from .networks import checksum_address, get_networks, get_web3_clients, NetworkConfig
+from .router import cached_gas_price, cached_nonce, invalidate_nonce
 
 
 class TransactionSender:
@@ -42,7 +43,7 @@ class TransactionSender:
             )
         self.private_key = key
 
-    def send_transfer(
+    async def send_transfer(
         self,
         network_name: str,
         from_address: str,
@@ -69,14 +70,17 @@ class TransactionSender:
             raise ValueError(f"Unsupported network '{network_name}'.")
         cfg: NetworkConfig = networks[network_name]
         clients = get_web3_clients()
-        w3: Web3 = clients[network_name]
+        w3: AsyncWeb3 = clients[network_name]
         try:
-            from_checksum = w3.to_checksum_address(from_address)
-            to_checksum = w3.to_checksum_address(to_address)
+            from_checksum = checksum_address(from_address)
+            to_checksum = checksum_address(to_address)
         except Exception as exc:
             raise ValueError(f"Invalid address provided: {exc}") from exc
-        nonce = w3.eth.get_transaction_count(from_checksum)
-        gas_price = w3.eth.gas_price
+        nonce = await cached_nonce(network_name, w3, from_checksum)
+        # Always sign with a fresh gas price: on chains with 2 s blocks a
+        # cached value can already be below the current base fee.  The
+        # fetched value still refreshes the cache used by estimates.
+        gas_price = await cached_gas_price(network_name, w3, ttl=0)
         tx = {
             "chainId": cfg.chain_id,
             "to": to_checksum,
@@ -84,12 +88,16 @@ class TransactionSender:
             "nonce": nonce,
             "gasPrice": gas_price,
         }
-        gas_limit = w3.eth.estimate_gas({
+        # Always estimate: a fixed 21000 is too low for contract recipients
+        # and, on Arbitrum, for any transfer.
+        gas_limit = await w3.eth.estimate_gas({
             "from": from_checksum,
             "to": to_checksum,
             "value": amount_wei,
         })
         tx["gas"] = gas_limit
         signed_tx = w3.eth.account.sign_transaction(tx, private_key=self.private_key)
-        tx_hash = w3.eth.send_raw_transaction(signed_tx.rawTransaction)
+        tx_hash = await w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+        # The account's nonce has advanced; force the next lookup to hit the node.
+        invalidate_nonce(network_name, from_checksum)
         return w3.to_hex(tx_hash)
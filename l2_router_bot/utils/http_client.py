@@ -0,0 +1,54 @@
+"""Shared HTTP clients scoped to the running event loop.
+
+An :class:`httpx.AsyncClient` keeps its connection pool bound to the
+event loop it first ran on.  Reusing it from another loop, for example
+across successive ``asyncio.run`` calls when the package is used
+programmatically, fails with ``RuntimeError: Event loop is closed``.
+:class:`LoopLocalClient` therefore keeps one client per running loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import weakref
+from typing import Any
+
+import httpx  # type: ignore
+
+
+class LoopLocalClient:
+    """Holder for one :class:`httpx.AsyncClient` per running event loop.
+
+    Args:
+        **client_kwargs: Keyword arguments used to create a client lazily
+            when none has been installed for the running loop.
+    """
+
+    def __init__(self, **client_kwargs: Any) -> None:
+        self._client_kwargs = client_kwargs
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def get(self) -> httpx.AsyncClient:
+        """Return the client for the running loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = httpx.AsyncClient(**self._client_kwargs)
+            self._clients[loop] = client
+        return client
+
+    async def set(self, client: httpx.AsyncClient) -> None:
+        """Use ``client`` on the running loop, closing any client it replaces."""
+        loop = asyncio.get_running_loop()
+        previous = self._clients.get(loop)
+        self._clients[loop] = client
+        if previous is not None and previous is not client:
+            await previous.aclose()
+
+    async def aclose(self) -> None:
+        """Close the running loop's client, if one has been created."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
@@ -4,17 +4,27 @@ This module defines a helper to fetch the current USD price for
 Ethereum and related tokens using the public CoinGecko API.  The
 function is asynchronous and utilises the `httpx` library to
 perform HTTP requests.  Should the request fail or a token not be
-available, the function returns ``None``.  In production
-deployments you may wish to cache results to avoid repeatedly
-calling the external API and to handle API rate limits.
+available, the function returns ``None``.
+
+Prices are cached in memory for ``PRICE_TTL_SECONDS`` seconds (30 by
+default, overridable via the environment variable of the same name)
+to avoid repeatedly calling the external API and to stay within its
+rate limits.  Requests share a single long-lived HTTP client so that
+the connection to CoinGecko is kept alive between calls.
 """
 
 from __future__ import annotations
 
-from typing import Optional
+import asyncio
+import os
+import time
+import weakref
+from typing import Dict, Optional, Tuple
 
 import httpx  # type: ignore
 
+from .http_client import LoopLocalClient
+
 
 # Mapping from native token symbols to CoinGecko IDs.  Extend this
 # dictionary when adding support for tokens beyond Ether on L2
@@ -23,6 +33,34 @@ TOKEN_ID_MAP = {
     "ETH": "ethereum",
 }
 
+PRICE_TTL_SECONDS = float(os.getenv("PRICE_TTL_SECONDS", "30"))
+
+_PRICE_CACHE: Dict[str, Tuple[float, float]] = {}
+# Per-token locks that collapse concurrent cache misses into a single
+# request.  Like the HTTP client, locks are bound to an event loop, so
+# they are kept per running loop.
+_PRICE_LOCKS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Lock]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Long-lived HTTP client (one per event loop), normally installed and
+# closed by the FastAPI application's startup and shutdown hooks.  It is
+# created lazily when this module is used outside the application.
+_clients = LoopLocalClient(timeout=10)
+
+
+async def set_client(client: httpx.AsyncClient) -> None:
+    """Use ``client`` for price requests on the running event loop.
+
+    Any client it replaces is closed.
+    """
+    await _clients.set(client)
+
+
+async def aclose() -> None:
+    """Close the running event loop's shared HTTP client."""
+    await _clients.aclose()
+
 
 async def get_token_price(symbol: str) -> Optional[float]:
     """Retrieve the current USD price for a given native token symbol.
@@ -30,6 +68,9 @@ async def get_token_price(symbol: str) -> Optional[float]:
     Args:
         symbol: Ticker symbol for the native token (e.g. ``"ETH"``).
 
+    Results are served from an in-memory cache while they are younger
+    than :data:`PRICE_TTL_SECONDS`.
+
     Returns:
         The current price in USD, or ``None`` if the symbol is
         unsupported or the request fails.
@@ -38,17 +79,35 @@ async def get_token_price(symbol: str) -> Optional[float]:
     token_id = TOKEN_ID_MAP.get(symbol.upper())
     if token_id is None:
         return None
-    url = (
-        "https://api.coingecko.com/api/v3/simple/price?"
-        f"ids={token_id}&vs_currencies=usd"
-    )
-    try:
-        async with httpx.AsyncClient(timeout=10) as client:
-            response = await client.get(url)
+    cached = _PRICE_CACHE.get(token_id)
+    if cached is not None and time.monotonic() - cached[0] < PRICE_TTL_SECONDS:
+        return cached[1]
+    # Concurrent callers for the same token wait for a single request
+    # instead of each hitting the API.
+    loop = asyncio.get_running_loop()
+    locks = _PRICE_LOCKS.get(loop)
+    if locks is None:
+        locks = _PRICE_LOCKS[loop] = {}
+    lock = locks.get(token_id)
+    if lock is None:
+        lock = locks[token_id] = asyncio.Lock()
+    async with lock:
+        cached = _PRICE_CACHE.get(token_id)
+        if cached is not None and time.monotonic() - cached[0] < PRICE_TTL_SECONDS:
+            return cached[1]
+        url = (
+            "https://api.coingecko.com/api/v3/simple/price?"
+            f"ids={token_id}&vs_currencies=usd"
+        )
+        try:
+            response = await _clients.get().get(url)
             response.raise_for_status()
             data = response.json()
             price = data.get(token_id, {}).get("usd")
-            return float(price) if price is not None else None
-    except Exception:
-        # On any error (network, JSON parsing, missing key) return None
-        return None
+        except Exception:
+            # On any error (network, JSON parsing, missing key) return None
+            return None
+        if price is None:
+            return None
+        _PRICE_CACHE[token_id] = (time.monotonic(), float(price))
+        return float(price)
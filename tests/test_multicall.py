@@ -0,0 +1,79 @@
+"""Unit tests for Multicall3 calldata encoding, decoding and dispatch."""
+
+import asyncio
+
+from eth_abi import decode, encode
+
+from l2_router_bot.multicall import (
+    MULTICALL3_ADDRESS,
+    decode_aggregate3,
+    encode_aggregate3,
+    get_l1_fee_params,
+    multicall,
+)
+from l2_router_bot.networks import DEFAULT_NETWORKS
+
+
+def test_encode_aggregate3_prefixes_selector():
+    target = "0x420000000000000000000000000000000000000F"
+    calldata = encode_aggregate3([(target, bytes.fromhex("519b4bd3"))])
+    assert calldata[:4] == bytes.fromhex("82ad56cb")
+    (calls,) = decode(["(address,bool,bytes)[]"], calldata[4:])
+    assert calls[0][0].lower() == target.lower()
+    assert calls[0][1] is False
+    assert calls[0][2] == bytes.fromhex("519b4bd3")
+
+
+def test_decode_aggregate3_maps_failures_to_none():
+    raw = encode(["(bool,bytes)[]"], [[(True, b"\x01"), (False, b"")]])
+    assert decode_aggregate3(raw) == [b"\x01", None]
+
+
+class _FakeEth:
+    """Answers ``aggregate3`` by returning each call's selector as a uint256."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def call(self, tx):
+        self.calls.append(tx)
+        data = bytes.fromhex(tx["data"][2:])
+        (calls,) = decode(["(address,bool,bytes)[]"], data[4:])
+        results = [(True, int.from_bytes(calldata, "big").to_bytes(32, "big")) for _, _, calldata in calls]
+        return encode(["(bool,bytes)[]"], [results])
+
+
+class _FakeWeb3:
+    def __init__(self):
+        self.eth = _FakeEth()
+
+
+def test_multicall_sends_single_eth_call():
+    w3 = _FakeWeb3()
+    target = "0x420000000000000000000000000000000000000F"
+    returned = asyncio.run(
+        multicall(w3, [(target, bytes.fromhex("00000001")), (target, bytes.fromhex("00000002"))])
+    )
+    assert len(w3.eth.calls) == 1
+    assert w3.eth.calls[0]["to"] == MULTICALL3_ADDRESS
+    assert [int.from_bytes(data, "big") for data in returned] == [1, 2]
+
+
+def test_multicall_without_calls_skips_rpc():
+    w3 = _FakeWeb3()
+    assert asyncio.run(multicall(w3, [])) == []
+    assert w3.eth.calls == []
+
+
+def test_get_l1_fee_params_reads_oracle_in_one_call():
+    w3 = _FakeWeb3()
+    params = asyncio.run(get_l1_fee_params(DEFAULT_NETWORKS["optimism"], w3))
+    assert len(w3.eth.calls) == 1
+    assert params["l1_base_fee"] == 0x519B4BD3
+    assert params["blob_base_fee_scalar"] == 0x68D5DCA6
+
+
+def test_get_l1_fee_params_empty_without_oracle():
+    w3 = _FakeWeb3()
+    assert asyncio.run(get_l1_fee_params(DEFAULT_NETWORKS["arbitrum"], w3)) == {}
+    assert w3.eth.calls == []
@@ -0,0 +1,23 @@
+"""Unit tests for network configuration and client memoisation."""
+
+from l2_router_bot import networks
+
+
+def test_get_networks_reads_env_override_after_reset(monkeypatch):
+    monkeypatch.setenv("BASE_RPC_URL", "http://localhost:8545")
+    networks._reset_clients()
+    try:
+        assert networks.get_networks()["base"].rpc_url == "http://localhost:8545"
+        assert networks.get_networks()["arbitrum"].rpc_url == "https://arb1.arbitrum.io/rpc"
+    finally:
+        networks._reset_clients()
+
+
+def test_get_web3_clients_is_memoised():
+    networks._reset_clients()
+    assert networks.get_web3_clients() is networks.get_web3_clients()
+
+
+def test_checksum_address_normalises_lowercase():
+    lower = "0xca11bde05977b3631167028862be2a173976ca11"
+    assert networks.checksum_address(lower) == "0xcA11bde05977b3631167028862bE2a173976CA11"
@@ -0,0 +1,113 @@
+"""Unit tests for the cached CoinGecko price feed.
+
+Requests are served by :class:`httpx.MockTransport`, so no network
+access is needed.
+"""
+
+import asyncio
+import importlib
+import time
+
+import httpx
+import pytest
+
+from l2_router_bot.utils import price_feed
+
+
+@pytest.fixture(autouse=True)
+def _clear_price_cache():
+    price_feed._PRICE_CACHE.clear()
+    yield
+    price_feed._PRICE_CACHE.clear()
+
+
+def _counting_handler(requests, price=2000.0):
+    async def handler(request):
+        requests.append(request)
+        # Yield to the event loop so concurrent callers overlap.
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"ethereum": {"usd": price}})
+
+    return handler
+
+
+def _run_with_transport(handler, coro_factory):
+    async def _go():
+        await price_feed.set_client(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        try:
+            return await coro_factory()
+        finally:
+            await price_feed.aclose()
+
+    return asyncio.run(_go())
+
+
+def test_get_token_price_serves_cache_hits():
+    requests = []
+
+    async def twice():
+        return [await price_feed.get_token_price("ETH"), await price_feed.get_token_price("eth")]
+
+    assert _run_with_transport(_counting_handler(requests), twice) == [2000.0, 2000.0]
+    assert len(requests) == 1
+
+
+def test_get_token_price_refetches_after_expiry():
+    requests = []
+
+    async def expire_between_calls():
+        first = await price_feed.get_token_price("ETH")
+        ts, value = price_feed._PRICE_CACHE["ethereum"]
+        price_feed._PRICE_CACHE["ethereum"] = (ts - price_feed.PRICE_TTL_SECONDS - 1, value)
+        second = await price_feed.get_token_price("ETH")
+        return first, second
+
+    assert _run_with_transport(_counting_handler(requests), expire_between_calls) == (2000.0, 2000.0)
+    assert len(requests) == 2
+
+
+def test_concurrent_callers_share_one_request():
+    requests = []
+
+    async def concurrent():
+        return await asyncio.gather(*(price_feed.get_token_price("ETH") for _ in range(5)))
+
+    assert _run_with_transport(_counting_handler(requests), concurrent) == [2000.0] * 5
+    assert len(requests) == 1
+
+
+def test_concurrent_callers_work_across_event_loops():
+    requests = []
+
+    async def concurrent():
+        return await asyncio.gather(*(price_feed.get_token_price("ETH") for _ in range(3)))
+
+    for _ in range(2):
+        price_feed._PRICE_CACHE.clear()
+        assert _run_with_transport(_counting_handler(requests), concurrent) == [2000.0] * 3
+    assert len(requests) == 2
+
+
+def test_failed_request_is_not_cached():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(503)
+
+    async def twice():
+        return [await price_feed.get_token_price("ETH"), await price_feed.get_token_price("ETH")]
+
+    assert _run_with_transport(handler, twice) == [None, None]
+    assert len(requests) == 2
+
+
+def test_price_ttl_env_override(monkeypatch):
+    monkeypatch.setenv("PRICE_TTL_SECONDS", "5")
+    try:
+        importlib.reload(price_feed)
+        assert price_feed.PRICE_TTL_SECONDS == 5.0
+    finally:
+        monkeypatch.delenv("PRICE_TTL_SECONDS")
+        importlib.reload(price_feed)
+    assert price_feed.PRICE_TTL_SECONDS == 30.0
@@ -1,12 +1,18 @@
-"""Unit tests for router selection logic.
+"""Unit tests for router selection and caching logic.
 
 The tests in this file verify that the cheapest network is selected
-correctly when provided with synthetic cost data.  Network
-estimation is not exercised here because it requires access to live
-RPC endpoints.  For integration testing you may provide mocked
-Web3 clients or run tests against a local blockchain instance.
+correctly when provided with synthetic cost data, and that the gas
+price and nonce caches avoid redundant RPC calls.  Network
+estimation is only exercised with a stubbed JSON‑RPC batch client
+because it otherwise requires access to live RPC endpoints.  For
+integration testing you may provide mocked Web3 clients or run tests
+against a local blockchain instance.
 """
 
+import asyncio
+
+from l2_router_bot import router
+from l2_router_bot.networks import DEFAULT_NETWORKS
 from l2_router_bot.router import select_cheapest_network
 
 
@@ -34,3 +40,147 @@ def test_select_cheapest_network_none_when_all_fail():
         "optimism": {"error": "failed"},
     }
     assert select_cheapest_network(costs) is None
+
+
+class _FakeEth:
+    def __init__(self):
+        self.gas_price_calls = 0
+        self.nonce_calls = 0
+        self.estimate_calls = []
+
+    @property
+    def gas_price(self):
+        self.gas_price_calls += 1
+
+        async def _value():
+            return 100
+
+        return _value()
+
+    async def get_transaction_count(self, address):
+        self.nonce_calls += 1
+        return 7
+
+    async def estimate_gas(self, tx):
+        self.estimate_calls.append(tx)
+        return 30000
+
+
+class _FakeWeb3:
+    def __init__(self):
+        self.eth = _FakeEth()
+
+
+def test_cached_gas_price_reuses_value_within_ttl():
+    router._GAS_CACHE.clear()
+    w3 = _FakeWeb3()
+    assert asyncio.run(router.cached_gas_price("arbitrum", w3)) == 100
+    assert asyncio.run(router.cached_gas_price("arbitrum", w3)) == 100
+    assert w3.eth.gas_price_calls == 1
+    assert asyncio.run(router.cached_gas_price("arbitrum", w3, ttl=0)) == 100
+    assert w3.eth.gas_price_calls == 2
+
+
+def test_invalidate_nonce_forces_refetch():
+    router._NONCE_CACHE.clear()
+    w3 = _FakeWeb3()
+    assert asyncio.run(router.cached_nonce("base", w3, "0xabc")) == 7
+    assert asyncio.run(router.cached_nonce("base", w3, "0xabc")) == 7
+    assert w3.eth.nonce_calls == 1
+    router.invalidate_nonce("base", "0xabc")
+    assert asyncio.run(router.cached_nonce("base", w3, "0xabc")) == 7
+    assert w3.eth.nonce_calls == 2
+
+
+def test_empty_caches_are_misses_shortly_after_boot(monkeypatch):
+    # time.monotonic() counts from boot on Linux, so it can be below the TTLs.
+    monkeypatch.setattr(router.time, "monotonic", lambda: 0.5)
+    router._GAS_CACHE.clear()
+    router._NONCE_CACHE.clear()
+    w3 = _FakeWeb3()
+    assert router._fresh_gas_price("arbitrum") is None
+    assert asyncio.run(router.cached_gas_price("arbitrum", w3)) == 100
+    assert asyncio.run(router.cached_nonce("base", w3, "0xabc")) == 7
+    assert w3.eth.gas_price_calls == 1
+    assert w3.eth.nonce_calls == 1
+
+
+def test_known_gas_limit_only_for_plain_transfers(monkeypatch):
+    optimism = DEFAULT_NETWORKS["optimism"]
+    monkeypatch.setattr(router, "SKIP_GAS_ESTIMATE", True)
+    assert router.known_gas_limit(optimism, {"to": "0xabc", "value": 1}) == 21000
+    assert router.known_gas_limit(optimism, {"to": "0xabc", "value": 1, "data": "0x01"}) is None
+    monkeypatch.setattr(router, "SKIP_GAS_ESTIMATE", False)
+    assert router.known_gas_limit(optimism, {"to": "0xabc", "value": 1}) is None
+
+
+def test_known_gas_limit_never_fixed_on_arbitrum(monkeypatch):
+    monkeypatch.setattr(router, "SKIP_GAS_ESTIMATE", True)
+    assert router.known_gas_limit(DEFAULT_NETWORKS["arbitrum"], {"to": "0xabc", "value": 1}) is None
+
+
+def test_estimate_without_usd_skips_price_feed(monkeypatch):
+    async def fake_batch_request(url, calls):
+        return ["0x64" if method == "eth_gasPrice" else "0x5208" for method, _ in calls]
+
+    price_lookups = []
+
+    async def record_price(symbol):
+        price_lookups.append(symbol)
+        return 2000.0
+
+    router._GAS_CACHE.clear()
+    monkeypatch.setattr(router, "batch_request", fake_batch_request)
+    monkeypatch.setattr(router, "get_token_price", record_price)
+    address = "0x" + "11" * 20
+    costs = asyncio.run(
+        router.estimate_transfer_costs(address, address, 10**18, include_usd=False)
+    )
+    assert price_lookups == []
+    assert costs
+    for data in costs.values():
+        assert data["total_fee_wei"] == 100 * 21000
+        assert data["total_fee_usd"] is None
+
+
+def test_estimate_falls_back_to_single_calls_when_batch_rejected(monkeypatch):
+    async def reject_batch(url, calls):
+        raise router.BatchNotSupportedError("batch rejected")
+
+    clients = {name: _FakeWeb3() for name in router.get_networks()}
+    router._GAS_CACHE.clear()
+    monkeypatch.setattr(router, "batch_request", reject_batch)
+    monkeypatch.setattr(router, "get_web3_clients", lambda: clients)
+    address = "0x" + "11" * 20
+    costs = asyncio.run(
+        router.estimate_transfer_costs(address, address, 10**18, include_usd=False)
+    )
+    assert set(costs) == set(clients)
+    for name, data in costs.items():
+        assert data["total_fee_wei"] == 100 * 30000
+        assert clients[name].eth.gas_price_calls == 1
+        assert clients[name].eth.estimate_calls == [
+            {"from": address, "to": address, "value": 10**18}
+        ]
+        assert clients[name].eth.nonce_calls == 0
+
+
+def test_skip_gas_estimate_still_estimates_arbitrum(monkeypatch):
+    batches = {}
+
+    async def fake_batch_request(url, calls):
+        batches[url] = [method for method, _ in calls]
+        return ["0x64" if method == "eth_gasPrice" else "0x7530" for method, _ in calls]
+
+    router._GAS_CACHE.clear()
+    monkeypatch.setattr(router, "SKIP_GAS_ESTIMATE", True)
+    monkeypatch.setattr(router, "batch_request", fake_batch_request)
+    address = "0x" + "11" * 20
+    costs = asyncio.run(
+        router.estimate_transfer_costs(address, address, 10**18, include_usd=False)
+    )
+    networks = router.get_networks()
+    assert batches[networks["arbitrum"].rpc_url] == ["eth_gasPrice", "eth_estimateGas"]
+    assert batches[networks["optimism"].rpc_url] == ["eth_gasPrice"]
+    assert costs["arbitrum"]["estimated_gas"] == 30000
+    assert costs["optimism"]["estimated_gas"] == 21000
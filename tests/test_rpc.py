@@ -0,0 +1,86 @@
+"""Unit tests for the JSON‑RPC batch client.
+
+Requests are served by :class:`httpx.MockTransport`, so no network
+access is needed.
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from l2_router_bot import rpc
+
+URL = "http://rpc.test"
+
+
+def _run_batch(handler, calls):
+    async def _go():
+        await rpc.set_client(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        try:
+            return await rpc.batch_request(URL, calls)
+        finally:
+            await rpc.aclose()
+
+    return asyncio.run(_go())
+
+
+def test_batch_request_encodes_payload_and_orders_results():
+    seen = []
+
+    def handler(request):
+        payload = json.loads(request.content)
+        seen.append(payload)
+        # Answer out of order; results must still follow the call order.
+        body = [{"jsonrpc": "2.0", "id": item["id"], "result": item["method"]} for item in payload]
+        return httpx.Response(200, json=list(reversed(body)))
+
+    calls = [("eth_gasPrice", []), ("eth_getTransactionCount", ["0xabc", "pending"])]
+    assert _run_batch(handler, calls) == ["eth_gasPrice", "eth_getTransactionCount"]
+    assert seen == [[
+        {"jsonrpc": "2.0", "id": 0, "method": "eth_gasPrice", "params": []},
+        {"jsonrpc": "2.0", "id": 1, "method": "eth_getTransactionCount", "params": ["0xabc", "pending"]},
+    ]]
+
+
+def test_batch_request_missing_id_is_batch_not_supported():
+    def handler(request):
+        return httpx.Response(200, json=[{"jsonrpc": "2.0", "id": 0, "result": "0x1"}])
+
+    with pytest.raises(rpc.BatchNotSupportedError):
+        _run_batch(handler, [("eth_gasPrice", []), ("eth_chainId", [])])
+
+
+def test_batch_request_item_error_raises_rpc_error():
+    def handler(request):
+        return httpx.Response(
+            200,
+            json=[{"jsonrpc": "2.0", "id": 0, "error": {"code": -32000, "message": "insufficient funds"}}],
+        )
+
+    with pytest.raises(rpc.RPCError, match="insufficient funds"):
+        _run_batch(handler, [("eth_estimateGas", [{}])])
+
+
+def test_batch_request_non_list_response_is_batch_not_supported():
+    def handler(request):
+        return httpx.Response(
+            200,
+            json={"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "batch not supported"}},
+        )
+
+    with pytest.raises(rpc.BatchNotSupportedError):
+        _run_batch(handler, [("eth_gasPrice", [])])
+
+
+@pytest.mark.parametrize("status", [400, 405, 413])
+def test_batch_request_rejection_statuses(status):
+    with pytest.raises(rpc.BatchNotSupportedError):
+        _run_batch(lambda request: httpx.Response(status), [("eth_gasPrice", [])])
+
+
+@pytest.mark.parametrize("status", [401, 403, 429, 502])
+def test_batch_request_other_errors_are_raised(status):
+    with pytest.raises(httpx.HTTPStatusError):
+        _run_batch(lambda request: httpx.Response(status), [("eth_gasPrice", [])])
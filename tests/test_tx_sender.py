@@ -0,0 +1,78 @@
+"""Unit tests for transaction building and broadcasting.
+
+Web3 is replaced by a fake client, so no RPC endpoint or real key is
+needed.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from web3 import Web3
+
+from l2_router_bot import router, tx_sender
+from l2_router_bot.tx_sender import TransactionSender
+
+ADDRESS = "0x" + "11" * 20
+
+
+class _FakeAccount:
+    def __init__(self):
+        self.signed = []
+
+    def sign_transaction(self, tx, private_key):
+        self.signed.append(tx)
+        return SimpleNamespace(raw_transaction=b"\xde\xad")
+
+
+class _FakeEth:
+    def __init__(self):
+        self.account = _FakeAccount()
+        self.sent = []
+
+    @property
+    def gas_price(self):
+        async def _value():
+            return 100
+
+        return _value()
+
+    async def get_transaction_count(self, address):
+        return 7
+
+    async def estimate_gas(self, tx):
+        return 30000
+
+    async def send_raw_transaction(self, raw):
+        self.sent.append(raw)
+        return b"\x12\x34"
+
+
+class _FakeWeb3:
+    to_hex = staticmethod(Web3.to_hex)
+
+    def __init__(self):
+        self.eth = _FakeEth()
+
+
+def test_send_transfer_signs_with_fresh_gas_price_and_estimate(monkeypatch):
+    w3 = _FakeWeb3()
+    monkeypatch.setattr(tx_sender, "get_web3_clients", lambda: {"base": w3})
+    router._NONCE_CACHE.clear()
+    # A stale cached gas price must not be used for signing.
+    router._GAS_CACHE["base"] = (router.time.monotonic(), 1)
+    sender = TransactionSender(private_key="0x" + "22" * 32)
+
+    tx_hash = asyncio.run(sender.send_transfer("base", ADDRESS, ADDRESS, 10**18))
+
+    assert tx_hash == "0x1234"
+    assert w3.eth.account.signed == [{
+        "chainId": 8453,
+        "to": Web3.to_checksum_address(ADDRESS),
+        "value": 10**18,
+        "nonce": 7,
+        "gasPrice": 100,
+        "gas": 30000,
+    }]
+    assert w3.eth.sent == [b"\xde\xad"]
+    assert ("base", Web3.to_checksum_address(ADDRESS)) not in router._NONCE_CACHE
+    router._GAS_CACHE.clear()